@@ -21,18 +21,33 @@ class InvalidParameterError(NBAApiError):
 class NBAApiClient:
     BASE_URL = "https://api-nba-v1.p.rapidapi.com"
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, base_url: Optional[str] = None, timeout: Optional[float] = None):
         """
         Initialize the API client with an API key
         :param api_key: Your RapidAPI key
+        :param base_url: Optional base URL overriding BASE_URL (e.g., a local NBAProxyServer)
+        :param timeout: Optional number of seconds to wait for the API before giving up
         """
         if not api_key:
             raise ValueError("API key must be provided.")
+        if base_url:
+            self.BASE_URL = base_url.rstrip("/")
+        self.timeout = timeout
         self.headers = {
             "X-RapidAPI-Key": api_key,
             "X-RapidAPI-Host": "api-nba-v1.p.rapidapi.com",
         }
 
+    def _send(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Send an HTTP GET request to the NBA API without checking the status code
+        :param endpoint: API endpoint
+        :param params: Optional query parameters
+        :return: Raw HTTP response
+        """
+        url = f"{self.BASE_URL}/{endpoint}"
+        return requests.get(url, headers=self.headers, params=params, timeout=self.timeout)
+
     def _request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict:
         """
         Send an HTTP GET request to the NBA API
@@ -40,8 +55,7 @@ class NBAApiClient:
         :param params: Optional query parameters
         :return: Parsed JSON response
         """
-        url = f"{self.BASE_URL}/{endpoint}"
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self._send(endpoint, params=params)
 
         if response.status_code == 429:
             raise RateLimitError("API rate limit exceeded. Please try again later.")
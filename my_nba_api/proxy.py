@@ -0,0 +1,428 @@
+import argparse
+import itertools
+import json
+import os
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, Any, List, Tuple
+
+import requests
+
+from .api_client import NBAApiClient, NBAApiError
+
+# Endpoints used by NBAApiClient; anything else is rejected by the proxy
+ENDPOINTS = {
+    "seasons",
+    "leagues",
+    "games",
+    "games/statistics",
+    "teams",
+    "teams/statistics",
+    "players",
+    "players/statistics",
+    "standings",
+}
+
+# Query parameters whose responses change constantly and are never cached
+UNCACHED_PARAMS = {"live"}
+
+
+class ProxyError(NBAApiError):
+    """Raised when the proxy cannot serve a request; carries the HTTP response to relay"""
+
+    def __init__(self, status_code: int, body: bytes, content_type: str = "application/json"):
+        super().__init__(f"Error {status_code}: {body.decode('utf-8', 'replace')}")
+        self.status_code = status_code
+        self.body = body
+        self.content_type = content_type
+
+    @classmethod
+    def from_message(cls, status_code: int, message: str) -> "ProxyError":
+        """
+        Build an error with a JSON body in the same shape as the NBA API's errors.
+        :param status_code: HTTP status code to relay.
+        :param message: Error message.
+        :return: The proxy error.
+        """
+        return cls(status_code, json.dumps({"message": message}).encode("utf-8"))
+
+
+class ResponseCache:
+    """Thread-safe in-memory cache of API responses with a fixed TTL and a size cap"""
+
+    def __init__(self, ttl: float, max_entries: int = 1024):
+        """
+        Initialize the cache
+        :param ttl: Number of seconds a response stays valid (0 disables caching)
+        :param max_entries: Maximum number of cached responses; the oldest are evicted first
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # Ordered by insertion, which with a fixed TTL is also expiry order
+        self._entries: "OrderedDict[Tuple, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Tuple) -> Optional[bytes]:
+        """
+        Fetch a cached response.
+        :param key: Cache key.
+        :return: The cached JSON body, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Tuple, value: bytes) -> None:
+        """
+        Store a response in the cache, dropping expired and excess entries.
+        :param key: Cache key.
+        :param value: JSON body to store.
+        """
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            while self._entries:
+                expires_at, _ = next(iter(self._entries.values()))
+                if expires_at > now:
+                    break
+                self._entries.popitem(last=False)
+            self._entries.pop(key, None)
+            self._entries[key] = (now + self.ttl, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class _InflightCall:
+    """An upstream request shared by every consumer asking for the same data"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[bytes] = None
+        self.error: Optional[Exception] = None
+
+
+class KeyPool:
+    """Rotates upstream requests across API keys, each with its own rate limit"""
+
+    def __init__(
+        self,
+        api_keys: List[str],
+        max_calls: Optional[int] = None,
+        period: float = 60.0,
+        timeout: Optional[float] = 10.0,
+    ):
+        """
+        Initialize the key pool
+        :param api_keys: RapidAPI keys to spread upstream requests over
+        :param max_calls: Maximum upstream calls per key within `period` (None for unlimited)
+        :param period: Length of the rate limiting window in seconds
+        :param timeout: Number of seconds each upstream request may take
+        """
+        if not api_keys:
+            raise ValueError("At least one API key must be provided.")
+        if max_calls is not None and max_calls < 1:
+            raise ValueError("max_calls must be at least 1.")
+        if period <= 0:
+            raise ValueError("period must be positive.")
+        if timeout is not None and timeout < 0:
+            raise ValueError("timeout must not be negative.")
+        self.clients = [NBAApiClient(api_key=key, timeout=timeout) for key in api_keys]
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = [deque() for _ in self.clients]
+        self._saturated_until = [0.0 for _ in self.clients]
+        self._order = itertools.cycle(range(len(self.clients)))
+        self._lock = threading.Lock()
+
+    def _ready_at(self, index: int, now: float) -> float:
+        """Time at which the key at `index` may be used again (<= now if it is free)."""
+        calls = self._calls[index]
+        while calls and calls[0] <= now - self.period:
+            calls.popleft()
+        ready_at = self._saturated_until[index]
+        if self.max_calls is not None and len(calls) >= self.max_calls:
+            ready_at = max(ready_at, calls[-self.max_calls] + self.period)
+        return ready_at
+
+    def acquire(self, deadline: float) -> NBAApiClient:
+        """
+        Pick the next client whose key has capacity, waiting for a free slot if needed.
+        :param deadline: time.monotonic() value after which to stop waiting.
+        :return: An upstream NBAApiClient.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                next_ready = None
+                for _ in range(len(self.clients)):
+                    index = next(self._order)
+                    ready_at = self._ready_at(index, now)
+                    if ready_at <= now:
+                        self._calls[index].append(now)
+                        return self.clients[index]
+                    next_ready = ready_at if next_ready is None else min(next_ready, ready_at)
+            if next_ready > deadline:
+                raise ProxyError.from_message(
+                    429, "Proxy rate limit exceeded for all API keys. Please try again later."
+                )
+            time.sleep(next_ready - now)
+
+    def saturate(self, client: NBAApiClient) -> None:
+        """
+        Take a key out of rotation until the current window ends, e.g. after an upstream 429.
+        :param client: The upstream client whose key was rate limited.
+        """
+        with self._lock:
+            index = self.clients.index(client)
+            self._saturated_until[index] = time.monotonic() + self.period
+
+
+class NBAProxyServer:
+    """
+    Local HTTP proxy in front of the NBA API.
+    Consumers point NBAApiClient at it via `base_url`; the proxy caches responses,
+    coalesces identical concurrent requests and spreads upstream calls over its API keys.
+    """
+
+    def __init__(
+        self,
+        api_keys: List[str],
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        cache_ttl: float = 60.0,
+        max_entries: int = 1024,
+        max_calls: Optional[int] = None,
+        period: float = 60.0,
+        timeout: float = 10.0,
+        max_wait: float = 30.0,
+    ):
+        """
+        Initialize the proxy server
+        :param api_keys: RapidAPI keys used for upstream requests
+        :param host: Interface to listen on
+        :param port: Port to listen on (0 picks a free port)
+        :param cache_ttl: Number of seconds responses are cached (live games are never cached)
+        :param max_entries: Maximum number of cached responses
+        :param max_calls: Maximum upstream calls per key within `period` (None for unlimited)
+        :param period: Length of the rate limiting window in seconds
+        :param timeout: Number of seconds each upstream request may take
+        :param max_wait: Number of seconds a request may wait for a free key slot
+        """
+        if max_wait < 0:
+            raise ValueError("max_wait must not be negative.")
+        self.keys = KeyPool(api_keys, max_calls=max_calls, period=period, timeout=timeout)
+        self.cache = ResponseCache(cache_ttl, max_entries=max_entries)
+        self.timeout = timeout
+        self.max_wait = max_wait
+        self._inflight: Dict[Tuple, _InflightCall] = {}
+        self._inflight_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+
+    @property
+    def clients(self) -> List[NBAApiClient]:
+        """Upstream clients, one per API key"""
+        return self.keys.clients
+
+    @property
+    def url(self) -> str:
+        """Base URL consumers should pass to NBAApiClient"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def fetch(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict:
+        """
+        Fetch an endpoint through the cache, coalescing identical in-flight requests.
+        :param endpoint: API endpoint
+        :param params: Optional query parameters
+        :return: Parsed JSON response (a fresh object for every caller)
+        """
+        return json.loads(self._fetch_body(endpoint, params))
+
+    def _fetch_body(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Fetch the JSON body of an endpoint through the cache and the in-flight calls.
+        :param endpoint: API endpoint
+        :param params: Optional query parameters
+        :return: JSON response body
+        """
+        if endpoint not in ENDPOINTS:
+            raise ProxyError.from_message(400, f"Unknown endpoint: {endpoint}")
+        params = params or {}
+        key = (endpoint, tuple(sorted(params.items())))
+        cacheable = not UNCACHED_PARAMS.intersection(params)
+
+        if cacheable:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        with self._inflight_lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                # The previous leader may have filled the cache since the check above
+                cached = self.cache.get(key) if cacheable else None
+                if cached is not None:
+                    return cached
+                call = self._inflight[key] = _InflightCall()
+
+        if not leader:
+            # A leader waits at most max_wait for key slots plus one timeout per key tried
+            if not call.done.wait(self.max_wait + self.timeout * len(self.clients)):
+                raise ProxyError.from_message(504, "Timed out waiting for the upstream response.")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result, data = self._fetch_upstream(endpoint, params)
+            # The API reports bad queries as a 200 with a non-empty "errors" object
+            if cacheable and not (isinstance(data, dict) and data.get("errors")):
+                self.cache.set(key, call.result)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            call.done.set()
+
+    def _fetch_upstream(self, endpoint: str, params: Dict[str, Any]) -> Tuple[bytes, Any]:
+        """
+        Fetch an endpoint from the NBA API, moving on to the next key when one is rate limited.
+        :param endpoint: API endpoint
+        :param params: Query parameters
+        :return: JSON response body and its parsed value
+        """
+        deadline = time.monotonic() + self.max_wait
+        for _ in range(len(self.clients)):
+            client = self.keys.acquire(deadline)
+            try:
+                response = client._send(endpoint, params=params or None)
+            except requests.Timeout:
+                raise ProxyError.from_message(504, "Upstream request timed out.")
+            except requests.RequestException as e:
+                raise ProxyError.from_message(502, f"Upstream request failed: {e}")
+            if response.status_code != 429:
+                break
+            self.keys.saturate(client)
+
+        if response.status_code != 200:
+            content_type = response.headers.get("Content-Type", "application/json")
+            raise ProxyError(response.status_code, response.content, content_type)
+        try:
+            return response.content, response.json()
+        except ValueError:
+            raise ProxyError.from_message(502, "Upstream returned an invalid JSON body.")
+
+    def _make_handler(self):
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urllib.parse.urlsplit(self.path)
+                endpoint = parsed.path.strip("/")
+                params = dict(urllib.parse.parse_qsl(parsed.query))
+                try:
+                    self._send(200, proxy._fetch_body(endpoint, params))
+                except ProxyError as e:
+                    self._send(e.status_code, e.body, e.content_type)
+                except Exception as e:
+                    error = ProxyError.from_message(500, f"Proxy error: {e}")
+                    self._send(error.status_code, error.body)
+
+            def _send(self, status: int, body: bytes, content_type: str = "application/json"):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self, poll_interval: float = 0.05) -> "NBAProxyServer":
+        """
+        Serve requests in a background thread.
+        :param poll_interval: Seconds between shutdown checks, bounding how long stop() blocks
+        :return: The proxy server itself.
+        """
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, kwargs={"poll_interval": poll_interval}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self, poll_interval: float = 0.05) -> None:
+        """
+        Serve requests in the current thread until shut down.
+        :param poll_interval: Seconds between shutdown checks
+        """
+        self.httpd.serve_forever(poll_interval=poll_interval)
+
+    def stop(self) -> None:
+        """Shut down the server and release its socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "NBAProxyServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Local caching proxy for the RapidAPI NBA API")
+    parser.add_argument("--key", action="append", dest="keys",
+                        help="RapidAPI key (repeatable; defaults to comma-separated NBA_API_KEYS)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--cache-ttl", type=float, default=60.0)
+    parser.add_argument("--max-entries", type=int, default=1024)
+    parser.add_argument("--max-calls", type=int, default=None, help="Upstream calls per key per period")
+    parser.add_argument("--period", type=float, default=60.0)
+    parser.add_argument("--timeout", type=float, default=10.0, help="Upstream request timeout in seconds")
+    parser.add_argument("--max-wait", type=float, default=30.0, help="Seconds to wait for a free key slot")
+    args = parser.parse_args(argv)
+
+    keys = args.keys or [k for k in os.environ.get("NBA_API_KEYS", "").split(",") if k]
+    if not keys:
+        parser.error("provide at least one --key or set NBA_API_KEYS")
+
+    proxy = NBAProxyServer(keys, host=args.host, port=args.port, cache_ttl=args.cache_ttl,
+                           max_entries=args.max_entries, max_calls=args.max_calls, period=args.period,
+                           timeout=args.timeout, max_wait=args.max_wait)
+    print(f"NBA API proxy listening on {proxy.url}")
+    try:
+        proxy.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        proxy.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
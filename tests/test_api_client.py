@@ -24,6 +24,7 @@ def test_get_seasons(mock_get, client):
         "https://api-nba-v1.p.rapidapi.com/seasons",
         headers=client.headers,
         params=None,
+        timeout=None,
     )
 
 @patch("requests.get")
@@ -38,6 +39,7 @@ def test_search_teams(mock_get, client):
         "https://api-nba-v1.p.rapidapi.com/teams",
         headers=client.headers,
         params={"search": "atl"},
+        timeout=None,
     )
 
 @patch("requests.get")
@@ -52,8 +54,30 @@ def test_search_players(mock_get, client):
         "https://api-nba-v1.p.rapidapi.com/players",
         headers=client.headers,
         params={"search": "james"},
+        timeout=None,
     )
 
+@patch("requests.get")
+def test_base_url_override(mock_get):
+    """Test pointing the client at another base URL, e.g. a local proxy."""
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.json.return_value = MOCK_SEASONS_RESPONSE
+
+    client = NBAApiClient(api_key="test_api_key", base_url="http://127.0.0.1:8000/", timeout=5)
+    assert client.BASE_URL == "http://127.0.0.1:8000"
+    client.get_seasons()
+    mock_get.assert_called_once_with(
+        "http://127.0.0.1:8000/seasons",
+        headers=client.headers,
+        params=None,
+        timeout=5,
+    )
+
+def test_default_base_url(client):
+    """Test that the default base URL is unchanged without an override."""
+    assert client.BASE_URL == "https://api-nba-v1.p.rapidapi.com"
+    assert NBAApiClient.BASE_URL == "https://api-nba-v1.p.rapidapi.com"
+
 @patch("requests.get")
 def test_rate_limit_error(mock_get, client):
     """Test rate limit error handling."""
@@ -0,0 +1,216 @@
+import inspect
+import json
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import patch
+from my_nba_api.api_client import NBAApiClient, NBAApiError, RateLimitError, InvalidParameterError
+from my_nba_api.proxy import NBAProxyServer, ProxyError, ResponseCache
+
+# Mock API responses
+MOCK_SEASONS_RESPONSE = {"seasons": ["2019", "2020", "2021"]}
+MOCK_TEAM_SEARCH_RESPONSE = {"teams": [{"id": 1, "name": "Atlanta Hawks"}]}
+
+def make_response(status_code, body):
+    """Build an upstream HTTP response with a JSON (dict) or raw text body."""
+    response = requests.Response()
+    response.status_code = status_code
+    if isinstance(body, dict):
+        response._content = json.dumps(body).encode("utf-8")
+        response.headers["Content-Type"] = "application/json"
+    else:
+        response._content = body.encode("utf-8")
+        response.headers["Content-Type"] = "text/plain"
+    return response
+
+@pytest.fixture
+def proxy():
+    """Fixture for a NBAProxyServer running on a free localhost port."""
+    with NBAProxyServer(api_keys=["key1", "key2"], port=0) as server:
+        yield server
+
+@pytest.fixture
+def client(proxy):
+    """Fixture for NBAApiClient instance pointed at the proxy."""
+    return NBAApiClient(api_key="unused", base_url=proxy.url)
+
+def test_proxy_caches_responses(proxy, client):
+    """Test that repeated calls are served from the proxy cache."""
+    with patch.object(proxy.clients[0], "_send", return_value=make_response(200, MOCK_SEASONS_RESPONSE)) as upstream:
+        assert client.get_seasons() == MOCK_SEASONS_RESPONSE
+        assert client.get_seasons() == MOCK_SEASONS_RESPONSE
+    upstream.assert_called_once_with("seasons", params=None)
+
+def test_proxy_forwards_params(proxy, client):
+    """Test that query parameters reach the upstream client."""
+    with patch.object(proxy.clients[0], "_send", return_value=make_response(200, MOCK_TEAM_SEARCH_RESPONSE)) as upstream:
+        assert client.search_teams(query="atl") == MOCK_TEAM_SEARCH_RESPONSE
+    upstream.assert_called_once_with("teams", params={"search": "atl"})
+
+def test_proxy_does_not_cache_live_games(proxy, client):
+    """Test that live game queries always reach the upstream API."""
+    with patch.object(proxy.clients[0], "_send", return_value=make_response(200, {"response": []})), \
+            patch.object(proxy.clients[1], "_send", return_value=make_response(200, {"response": []})):
+        client.get_live_games()
+        client.get_live_games()
+        assert proxy.clients[0]._send.call_count + proxy.clients[1]._send.call_count == 2
+
+def test_proxy_does_not_cache_error_payloads(proxy, client):
+    """Test that 200 responses reporting errors in their body are not cached."""
+    error_payload = {"errors": {"season": "The Season field is invalid."}, "response": []}
+    with patch.object(proxy.clients[0], "_send", return_value=make_response(200, error_payload)), \
+            patch.object(proxy.clients[1], "_send", return_value=make_response(200, error_payload)):
+        assert client.get_games_by_season(season=1) == error_payload
+        assert client.get_games_by_season(season=1) == error_payload
+        assert proxy.clients[0]._send.call_count + proxy.clients[1]._send.call_count == 2
+
+def test_proxy_returns_independent_copies(proxy):
+    """Test that changing a fetched response does not affect other callers or the cache."""
+    with patch.object(proxy.clients[0], "_send", return_value=make_response(200, MOCK_SEASONS_RESPONSE)):
+        proxy.fetch("seasons")["seasons"].append("2022")
+        assert proxy.fetch("seasons") == MOCK_SEASONS_RESPONSE
+
+def test_proxy_serves_every_client_method(proxy, client):
+    """Test that every public NBAApiClient method is accepted by the proxy."""
+    for name, method in inspect.getmembers(client, inspect.ismethod):
+        if name.startswith("_"):
+            continue
+        with patch.object(proxy.clients[0], "_send", return_value=make_response(200, {"response": name})), \
+                patch.object(proxy.clients[1], "_send", return_value=make_response(200, {"response": name})):
+            args = {param: 1 for param in inspect.signature(method).parameters}
+            assert method(**args) == {"response": name}
+
+@pytest.mark.parametrize("settings", [
+    {"max_calls": 0},
+    {"period": 0},
+    {"timeout": -1},
+    {"max_wait": -1},
+])
+def test_proxy_rejects_invalid_settings(settings):
+    """Test that invalid numeric settings are rejected up front."""
+    with pytest.raises(ValueError):
+        NBAProxyServer(api_keys=["key1"], port=0, **settings)
+
+def test_proxy_coalesces_concurrent_requests():
+    """Test that identical concurrent requests share one upstream call."""
+    barrier = threading.Barrier(5)
+
+    def slow_send(endpoint, params=None):
+        # Give the other consumers, released together by the barrier, time to join the call
+        time.sleep(0.2)
+        return make_response(200, MOCK_SEASONS_RESPONSE)
+
+    def consume():
+        barrier.wait(timeout=5)
+        results.append(proxy.fetch("seasons"))
+
+    results = []
+    with NBAProxyServer(api_keys=["key1"], port=0, cache_ttl=0) as proxy:
+        with patch.object(proxy.clients[0], "_send", side_effect=slow_send) as upstream:
+            consumers = [threading.Thread(target=consume) for _ in range(5)]
+            for consumer in consumers:
+                consumer.start()
+            for consumer in consumers:
+                consumer.join()
+    assert results == [MOCK_SEASONS_RESPONSE] * 5
+    upstream.assert_called_once()
+
+def test_proxy_follower_wait_is_bounded():
+    """Test that consumers coalesced onto a stuck upstream call give up with a 504."""
+    entered = threading.Event()
+    release = threading.Event()
+
+    def stuck_send(endpoint, params=None):
+        entered.set()
+        release.wait(timeout=5)
+        return make_response(200, MOCK_SEASONS_RESPONSE)
+
+    with NBAProxyServer(api_keys=["key1"], port=0, timeout=0.05, max_wait=0) as proxy:
+        with patch.object(proxy.clients[0], "_send", side_effect=stuck_send):
+            leader = threading.Thread(target=proxy.fetch, args=("seasons",))
+            leader.start()
+            assert entered.wait(timeout=5)
+            with pytest.raises(ProxyError) as excinfo:
+                proxy.fetch("seasons")
+            assert excinfo.value.status_code == 504
+            release.set()
+            leader.join()
+
+def test_proxy_rotates_and_rate_limits_keys():
+    """Test that upstream calls rotate over keys and stop once every key is exhausted."""
+    with NBAProxyServer(api_keys=["key1", "key2"], port=0, max_calls=1, max_wait=0) as proxy:
+        client = NBAApiClient(api_key="unused", base_url=proxy.url)
+        with patch.object(proxy.clients[0], "_send", return_value=make_response(200, {"response": 1})), \
+                patch.object(proxy.clients[1], "_send", return_value=make_response(200, {"response": 2})):
+            assert client.get_game_by_id(game_id=1) == {"response": 1}
+            assert client.get_game_by_id(game_id=2) == {"response": 2}
+            with pytest.raises(RateLimitError, match="API rate limit exceeded"):
+                client.get_game_by_id(game_id=3)
+
+def test_proxy_waits_for_a_free_key_slot():
+    """Test that a request waits for the rate limiting window instead of failing."""
+    with NBAProxyServer(api_keys=["key1"], port=0, max_calls=1, period=0.2, max_wait=1) as proxy:
+        client = NBAApiClient(api_key="unused", base_url=proxy.url)
+        with patch.object(proxy.clients[0], "_send", return_value=make_response(200, {"response": 1})) as upstream:
+            start = time.monotonic()
+            client.get_game_by_id(game_id=1)
+            client.get_game_by_id(game_id=2)
+            assert time.monotonic() - start >= 0.15
+        assert upstream.call_count == 2
+
+def test_proxy_retries_rate_limited_key_on_next_key():
+    """Test that an upstream 429 takes the key out of rotation and retries on another key."""
+    with NBAProxyServer(api_keys=["key1", "key2"], port=0, max_wait=0) as proxy:
+        client = NBAApiClient(api_key="unused", base_url=proxy.url)
+        with patch.object(proxy.clients[0], "_send", return_value=make_response(429, {"message": "Too many requests"})) as first, \
+                patch.object(proxy.clients[1], "_send", return_value=make_response(200, {"response": 2})) as second:
+            assert client.get_game_by_id(game_id=1) == {"response": 2}
+            assert client.get_game_by_id(game_id=2) == {"response": 2}
+        assert first.call_count == 1
+        assert second.call_count == 2
+
+def test_proxy_relays_upstream_errors(proxy, client):
+    """Test that upstream status codes and messages reach consumers unchanged."""
+    with patch.object(proxy.clients[0], "_send", return_value=make_response(400, {"message": "bad"})), \
+            patch.object(proxy.clients[1], "_send", return_value=make_response(500, "boom")):
+        with pytest.raises(InvalidParameterError, match="^Invalid parameters: bad$"):
+            client.get_games_by_date(date="invalid_date")
+        with pytest.raises(NBAApiError, match="^Error 500: boom$"):
+            client.get_seasons()
+
+@pytest.mark.parametrize("side_effect, status_code", [
+    (requests.ConnectionError("refused"), 502),
+    (requests.Timeout("slow"), 504),
+])
+def test_proxy_upstream_request_failures(proxy, client, side_effect, status_code):
+    """Test that upstream connection failures become a 502/504 instead of a dropped socket."""
+    with patch.object(proxy.clients[0], "_send", side_effect=side_effect):
+        with pytest.raises(NBAApiError, match=f"^Error {status_code}: "):
+            client.get_seasons()
+
+def test_proxy_invalid_upstream_json(proxy, client):
+    """Test that a non-JSON upstream body becomes a 502."""
+    with patch.object(proxy.clients[0], "_send", return_value=make_response(200, "<html>")):
+        with pytest.raises(NBAApiError, match="^Error 502: .*invalid JSON"):
+            client.get_seasons()
+
+def test_proxy_rejects_unknown_endpoint(proxy):
+    """Test that endpoints unknown to NBAApiClient are rejected."""
+    client = NBAApiClient(api_key="unused", base_url=proxy.url)
+    with pytest.raises(InvalidParameterError, match="Unknown endpoint: nope"):
+        client._request("nope")
+
+def test_response_cache_sweeps_and_caps_entries():
+    """Test that the cache drops expired entries and evicts the oldest beyond its cap."""
+    cache = ResponseCache(ttl=0.05, max_entries=2)
+    cache.set(("games", (("id", "1"),)), {"response": 1})
+    time.sleep(0.1)
+    cache.set(("games", (("id", "2"),)), {"response": 2})
+    assert len(cache) == 1
+
+    cache.set(("games", (("id", "3"),)), {"response": 3})
+    cache.set(("games", (("id", "4"),)), {"response": 4})
+    assert len(cache) == 2
+    assert cache.get(("games", (("id", "2"),))) is None
+    assert cache.get(("games", (("id", "4"),))) == {"response": 4}